@@ -0,0 +1,93 @@
+# cython: language_level=3
+"""Compiled auction core; see ``engine.auction`` for the interface and fallback.
+
+Build in place with::
+
+    cythonize -i engine/_auction.pyx
+"""
+
+from libc.limits cimport INT_MAX, INT_MIN, UINT_MAX
+
+# Outcomes returned by AuctionC.pass_auction (mirrored in engine/auction.py).
+cdef enum:
+    _OPEN = 0
+    _DECIDE = 1
+    _NO_BIDS = 2
+
+
+cdef class AuctionC:
+    """Packed-int auction state with the bidding rules of ``Game``.
+
+    ``highest_bidder`` is -1 while nobody has bid; ``active_mask`` has bit i
+    set while player i may still bid or pass.
+
+    Constructor and method arguments are taken as Python ints and
+    range-checked here, so an out-of-range value raises ValueError, never
+    OverflowError.  The fields are C ints, which makes the accepted domain
+    narrower than ``PyAuction``'s:
+
+    - ``card_idx`` and ``auctioneer`` must fit a C int;
+    - ``active_mask`` must be in 0..UINT_MAX (players 0-31);
+    - a valid bid above INT_MAX is rejected as out of range.
+
+    Assigning an out-of-range value to a field directly still raises
+    OverflowError.
+    """
+
+    cdef public int card_idx
+    cdef public int auctioneer
+    cdef public int highest_bid
+    cdef public int highest_bidder
+    cdef public unsigned int active_mask
+
+    def __init__(self, object card_idx, object auctioneer, object active_mask):
+        if not INT_MIN <= card_idx <= INT_MAX:
+            raise ValueError(f"card_idx {card_idx} is out of range")
+        if not INT_MIN <= auctioneer <= INT_MAX:
+            raise ValueError(f"auctioneer {auctioneer} is out of range")
+        if not 0 <= active_mask <= UINT_MAX:
+            raise ValueError(f"active_mask {active_mask} is out of range")
+        self.card_idx = card_idx
+        self.auctioneer = auctioneer
+        self.highest_bid = 0
+        self.highest_bidder = -1
+        self.active_mask = active_mask
+
+    cdef inline bint _is_active(self, object player):
+        return 0 <= player < 32 and (self.active_mask >> <int>player) & 1
+
+    cpdef process_bid(self, object player, object amount):
+        """Register a bid; raises ValueError where ``Game.process_bid`` does.
+
+        Also raises ValueError for a bid above INT_MAX.
+        """
+        if not self._is_active(player):
+            raise ValueError(f"Player {player} is not an active bidder")
+        if amount % 10 or amount <= self.highest_bid:
+            if amount % 10:
+                raise ValueError(f"Bid {amount} is not a multiple of 10")
+            raise ValueError(
+                f"Bid {amount} must be strictly higher than "
+                f"current bid {self.highest_bid}"
+            )
+        if amount > INT_MAX:
+            raise ValueError(f"Bid {amount} is out of range")
+        self.highest_bid = amount
+        self.highest_bidder = player
+
+    cpdef int pass_auction(self, object player) except -1:
+        """Drop a bidder and return AUCTION_OPEN, AUCTION_DECIDE or AUCTION_NO_BIDS."""
+        cdef unsigned int mask
+        cdef int i = 0
+        if not self._is_active(player):
+            raise ValueError(f"Player {player} is not an active bidder")
+        mask = self.active_mask & ~((<unsigned int>1) << <int>player)
+        self.active_mask = mask
+        if mask == 0 and self.highest_bid == 0:
+            return _NO_BIDS
+        if mask != 0 and (mask & (mask - 1)) == 0:
+            while not (mask >> i) & 1:
+                i += 1
+            self.highest_bidder = i
+            return _DECIDE
+        return _OPEN
@@ -0,0 +1,77 @@
+"""Packed-int auction core for search code (MCTS, rollouts).
+
+``Game`` keeps the readable ``AuctionState`` dataclass.  Search code that
+replays auctions millions of times can use ``AuctionC`` instead: the same
+bidding rules on plain int fields, with no phase bookkeeping.
+
+``AuctionC`` is the Cython extension in ``engine/_auction.pyx`` when it has
+been built (``cythonize -i engine/_auction.pyx``), and the pure-Python
+``PyAuction`` otherwise.  ``COMPILED`` tells which one is in use.  The
+extension stores C ints, so it rejects arguments outside that range with
+ValueError where ``PyAuction`` accepts them (see the ``AuctionC`` docstring).
+"""
+
+from __future__ import annotations
+
+# Outcomes returned by pass_auction.
+AUCTION_OPEN: int = 0     # Two or more bidders remain.
+AUCTION_DECIDE: int = 1   # One bidder remains: the auctioneer decides.
+AUCTION_NO_BIDS: int = 2  # Everyone passed without a bid: auctioneer takes it.
+
+
+class PyAuction:
+    """Pure-Python reference implementation of ``AuctionC``.
+
+    Attributes:
+        card_idx: AnimalType of the card being auctioned.
+        auctioneer: Index of the auctioneer.
+        highest_bid: Current top bid (0 means no bids yet).
+        highest_bidder: Player holding the top bid, or -1 if nobody has bid.
+        active_mask: Bit i is set while player i may still bid or pass.
+    """
+
+    __slots__ = (
+        "card_idx", "auctioneer", "highest_bid", "highest_bidder", "active_mask",
+    )
+
+    def __init__(self, card_idx: int, auctioneer: int, active_mask: int) -> None:
+        self.card_idx: int = card_idx
+        self.auctioneer: int = auctioneer
+        self.highest_bid: int = 0
+        self.highest_bidder: int = -1
+        self.active_mask: int = active_mask
+
+    def process_bid(self, player: int, amount: int) -> None:
+        """Register a bid; raises ValueError exactly where ``Game.process_bid`` does."""
+        if player < 0 or not (self.active_mask >> player) & 1:
+            raise ValueError(f"Player {player} is not an active bidder")
+        if amount % 10 or amount <= self.highest_bid:
+            if amount % 10:
+                raise ValueError(f"Bid {amount} is not a multiple of 10")
+            raise ValueError(
+                f"Bid {amount} must be strictly higher than "
+                f"current bid {self.highest_bid}"
+            )
+        self.highest_bid = amount
+        self.highest_bidder = player
+
+    def pass_auction(self, player: int) -> int:
+        """Drop a bidder and return AUCTION_OPEN, AUCTION_DECIDE or AUCTION_NO_BIDS."""
+        if player < 0 or not (self.active_mask >> player) & 1:
+            raise ValueError(f"Player {player} is not an active bidder")
+        mask = self.active_mask & ~(1 << player)
+        self.active_mask = mask
+        if mask == 0 and self.highest_bid == 0:
+            return AUCTION_NO_BIDS
+        if mask.bit_count() == 1:
+            self.highest_bidder = mask.bit_length() - 1
+            return AUCTION_DECIDE
+        return AUCTION_OPEN
+
+
+try:
+    from engine._auction import AuctionC
+    COMPILED: bool = True
+except ImportError:
+    AuctionC = PyAuction
+    COMPILED = False
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import io
+import random
+from dataclasses import dataclass
 from enum import Enum, auto
+from operator import add
 from typing import Optional
 
 from engine.models import AnimalCard, AnimalType, Deck, MoneyCard, MoneyValue, Player
@@ -18,6 +21,11 @@ STARTING_MONEY: list[MoneyValue] = (
     + [MoneyValue.FIFTY] * 1
 )
 
+# The same starting hand as per-denomination counts (Player.money_counts layout).
+STARTING_MONEY_COUNTS: tuple[int, ...] = tuple(
+    STARTING_MONEY.count(value) for value in MoneyValue
+)
+
 # Bank bonus paid to all players when each successive Donkey card is drawn.
 DONKEY_BONUS: dict[int, MoneyValue] = {
     1: MoneyValue.FIFTY,
@@ -44,7 +52,7 @@ class GamePhase(Enum):
 # Auction tracking
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AuctionState:
     """Snapshot of an in‑progress auction.
 
@@ -53,7 +61,8 @@ class AuctionState:
         auctioneer_index: Player who drew the card and opened the auction.
         highest_bid: Current top bid (0 means no bids yet).
         highest_bidder_index: Player who placed the top bid, or None.
-        active_bidders: Indices of players still eligible to bid/pass.
+        active_mask: Bitmask of players still eligible to bid/pass (bit i set
+            means player i is still in the auction).
         payer_index: Index of the player who must pay (set after auctioneer_decision).
         payee_index: Index of the player who receives the payment (set after auctioneer_decision).
         buyer_index: Index of the player who receives the animal card (set after auctioneer_decision).
@@ -63,11 +72,17 @@ class AuctionState:
     auctioneer_index: int
     highest_bid: int = 0
     highest_bidder_index: Optional[int] = None
-    active_bidders: list[int] = field(default_factory=list)
+    active_mask: int = 0
     payer_index: Optional[int] = None
     payee_index: Optional[int] = None
     buyer_index: Optional[int] = None
 
+    @property
+    def active_bidders(self) -> list[int]:
+        """Indices of players still in the auction, in ascending order."""
+        mask = self.active_mask
+        return [i for i in range(mask.bit_length()) if (mask >> i) & 1]
+
 
 # ---------------------------------------------------------------------------
 # Game
@@ -76,6 +91,11 @@ class AuctionState:
 class Game:
     """Manages the shared state of a Kuhhandel game.
 
+    Args:
+        players: Participating players (3-5).
+        rng: Random source for shuffling the deck; pass a seeded
+            ``random.Random`` for a reproducible game.
+
     Attributes:
         deck: The animal draw pile.
         players: Participating players (3-5).
@@ -83,28 +103,48 @@ class Game:
         phase: Current state‑machine phase.
         current_auction: Active auction data, or None.
         donkeys_drawn: Number of Donkey cards drawn so far this game.
+        ownership: Player x animal-type count matrix.  Row i is
+            ``players[i].animal_counts`` itself, so it is always current.
     """
 
-    def __init__(self, players: list[Player]) -> None:
+    def __init__(
+        self, players: list[Player], rng: Optional[random.Random] = None
+    ) -> None:
         if not MIN_PLAYERS <= len(players) <= MAX_PLAYERS:
             raise ValueError(
                 f"Kuhhandel requires {MIN_PLAYERS}-{MAX_PLAYERS} players, "
                 f"got {len(players)}"
             )
-        self.deck: Deck = Deck()
+        self.deck: Deck = Deck(rng)
         self.deck.shuffle()
         self.players: list[Player] = players
+        self.ownership: list[list[int]] = [p.animal_counts for p in players]
+        # Opening active-bidder mask for each possible auctioneer: everyone else.
+        everyone = (1 << len(players)) - 1
+        self._bidder_masks: tuple[int, ...] = tuple(
+            everyone & ~(1 << i) for i in range(len(players))
+        )
         self.current_turn: int = 0
         self.phase: GamePhase = GamePhase.TURN_START
         self.current_auction: Optional[AuctionState] = None
         self.donkeys_drawn: int = 0
+        # Cached __repr__ text and the display state it was built from.
+        self._repr_key: Optional[tuple] = None
+        self._repr_cache: str = ""
 
     # ── setup ──────────────────────────────────────────────────────────
 
     def deal_starting_money(self) -> None:
         """Give every player their seven starting money cards (2x0, 4x10, 1x50)."""
         for player in self.players:
-            player.add_money([MoneyCard(v) for v in STARTING_MONEY])
+            counts = player.money_counts
+            counts[:] = map(add, counts, STARTING_MONEY_COUNTS)
+
+    # ── queries ────────────────────────────────────────────────────────
+
+    def owners_of(self, animal_type: AnimalType) -> list[int]:
+        """Indices of players owning at least one card of ``animal_type``."""
+        return [i for i, row in enumerate(self.ownership) if row[animal_type]]
 
     # ── auction flow ───────────────────────────────────────────────────
 
@@ -134,14 +174,10 @@ class Game:
             for player in self.players:
                 player.add_money([MoneyCard(bonus_value)])
 
-        bidders = [
-            i for i in range(len(self.players))
-            if i != self.current_turn
-        ]
         self.current_auction = AuctionState(
             card=card,
             auctioneer_index=self.current_turn,
-            active_bidders=bidders,
+            active_mask=self._bidder_masks[self.current_turn],
         )
         self.phase = GamePhase.AUCTION_BIDDING
         return card
@@ -156,15 +192,16 @@ class Game:
         """
         auction = self._require_bidding()
 
-        if player_index not in auction.active_bidders:
+        if player_index < 0 or not (auction.active_mask >> player_index) & 1:
             raise ValueError(
                 f"Player {player_index} is not an active bidder"
             )
-        if amount % 10 != 0:
-            raise ValueError(
-                f"Bid {amount} is not a multiple of 10"
-            )
-        if amount <= auction.highest_bid:
+        # One combined test on the common path; split only to report the error.
+        if amount % 10 or amount <= auction.highest_bid:
+            if amount % 10:
+                raise ValueError(
+                    f"Bid {amount} is not a multiple of 10"
+                )
             raise ValueError(
                 f"Bid {amount} must be strictly higher than "
                 f"current bid {auction.highest_bid}"
@@ -191,20 +228,21 @@ class Game:
         """
         auction = self._require_bidding()
 
-        if player_index not in auction.active_bidders:
+        if player_index < 0 or not (auction.active_mask >> player_index) & 1:
             raise ValueError(
                 f"Player {player_index} is not an active bidder"
             )
 
-        auction.active_bidders.remove(player_index)
+        mask = auction.active_mask & ~(1 << player_index)
+        auction.active_mask = mask
 
-        if len(auction.active_bidders) == 0 and auction.highest_bid == 0:
+        if mask == 0 and auction.highest_bid == 0:
             # All bidders passed with no bids: auctioneer takes the animal free.
             self.players[auction.auctioneer_index].add_animal(auction.card)
             self._end_turn()
-        elif len(auction.active_bidders) == 1:
+        elif mask.bit_count() == 1:
             # Last bidder standing: let the auctioneer decide.
-            auction.highest_bidder_index = auction.active_bidders[0]
+            auction.highest_bidder_index = mask.bit_length() - 1
             self.phase = GamePhase.AUCTIONEER_DECISION
 
     def auctioneer_decision(self, sell: bool) -> None:
@@ -274,16 +312,13 @@ class Game:
         payee = self.players[auction.payee_index]
         buyer = self.players[auction.buyer_index]
 
-        # Validate that the payer actually holds every tendered card.
-        # Use a working copy to correctly handle duplicate denominations.
-        hand_copy = list(payer.money)
-        for card in cards_to_pay:
-            try:
-                hand_copy.remove(card)
-            except ValueError:
-                raise ValueError(
-                    f"Player {auction.payer_index} does not hold {card}"
-                )
+        # Validate that the payer actually holds every tendered card
+        # (duplicate denominations are counted).
+        missing = payer.missing_money(cards_to_pay)
+        if missing is not None:
+            raise ValueError(
+                f"Player {auction.payer_index} does not hold {missing}"
+            )
 
         # Validate that the total is sufficient.
         total = sum(card.amount for card in cards_to_pay)
@@ -321,18 +356,44 @@ class Game:
 
     # ── display ────────────────────────────────────────────────────────
 
+    def _repr_state(self) -> tuple:
+        """Everything __repr__ displays that can change during a game.
+
+        Player animals are tuples replaced on every ``add_animal``, so an
+        unchanged inventory compares equal by identity without a deep scan.
+        """
+        return (
+            self.phase,
+            self.current_turn,
+            self.deck.remaining,
+            *[(player.name, player.animals) for player in self.players],
+        )
+
     def __repr__(self) -> str:
-        lines: list[str] = [
-            f"=== Kuhhandel Game ===",
-            f"Phase: {self.phase.name}",
-            f"Turn: Player {self.current_turn} ({self.players[self.current_turn].name})",
-            f"Deck: {self.deck.remaining} cards remaining",
-            f"",
-            f"--- Player Inventories ---",
-        ]
+        # Rebuild only when the displayed state changed.  A snapshot is used
+        # instead of a dirty flag because callers may set public attributes
+        # such as current_turn directly.
+        key = self._repr_state()
+        if key != self._repr_key:
+            self._repr_cache = self._format_repr()
+            self._repr_key = key
+        return self._repr_cache
+
+    def _format_repr(self) -> str:
+        buf = io.StringIO()
+        write = buf.write
+        write("=== Kuhhandel Game ===\n")
+        write(f"Phase: {self.phase.name}\n")
+        write(f"Turn: Player {self.current_turn} ({self.players[self.current_turn].name})\n")
+        write(f"Deck: {self.deck.remaining} cards remaining\n")
+        write("\n--- Player Inventories ---")
         for i, player in enumerate(self.players):
-            animal_names = [card.name for card in player.animals]
-            lines.append(
-                f"  [{i}] {player.name}: {animal_names if animal_names else '(none)'}"
-            )
-        return "\n".join(lines)
+            write(f"\n  [{i}] {player.name}: ")
+            if player.animals:
+                # Same text as repr() of the list of names.
+                write("[")
+                write(", ".join([repr(card.name) for card in player.animals]))
+                write("]")
+            else:
+                write("(none)")
+        return buf.getvalue()
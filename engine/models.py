@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
-from enum import Enum
+from collections.abc import Iterable, Mapping
+from dataclasses import InitVar, dataclass, field
+from enum import Enum, IntEnum
+from operator import index as index_of, mul, sub
 from typing import Optional
 
 
@@ -12,26 +14,47 @@ from typing import Optional
 # Animal cards
 # ---------------------------------------------------------------------------
 
-class AnimalType(Enum):
-    """Every animal type in the game, paired with its quartet point value."""
+class AnimalType(IntEnum):
+    """Every animal type in the game, paired with its quartet point value.
+
+    The value of each member is its index (declaration order), so members
+    can index lookup tables and arrays directly.
+    """
+
+    ROOSTER = 0
+    GOOSE = 1
+    CAT = 2
+    DOG = 3
+    SHEEP = 4
+    GOAT = 5
+    DONKEY = 6
+    PIG = 7
+    COW = 8
+    HORSE = 9
+
+    @property
+    def animal_name(self) -> str:
+        return _ANIMAL_NAMES[self]
+
+    @property
+    def quartet_value(self) -> int:
+        return _QUARTET_VALUES[self]
 
-    ROOSTER = ("Rooster", 10)
-    GOOSE = ("Goose", 40)
-    CAT = ("Cat", 90)
-    DOG = ("Dog", 160)
-    SHEEP = ("Sheep", 250)
-    GOAT = ("Goat", 350)
-    DONKEY = ("Donkey", 500)
-    PIG = ("Pig", 650)
-    COW = ("Cow", 800)
-    HORSE = ("Horse", 1000)
 
-    def __init__(self, animal_name: str, quartet_value: int) -> None:
-        self.animal_name = animal_name
-        self.quartet_value = quartet_value
+# Per-type lookup tables, indexed by AnimalType.
+_ANIMAL_NAMES: tuple[str, ...] = (
+    "Rooster", "Goose", "Cat", "Dog", "Sheep",
+    "Goat", "Donkey", "Pig", "Cow", "Horse",
+)
+_QUARTET_VALUES: tuple[int, ...] = (
+    10, 40, 90, 160, 250, 350, 500, 650, 800, 1000,
+)
 
+# Animal types in declaration order (position == value).
+_ANIMAL_TYPES: tuple[AnimalType, ...] = tuple(AnimalType)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AnimalCard:
     """A single animal card.
 
@@ -43,16 +66,23 @@ class AnimalCard:
 
     @property
     def name(self) -> str:
-        return self.animal_type.animal_name
+        return _ANIMAL_NAMES[self.animal_type]
 
     @property
     def quartet_value(self) -> int:
-        return self.animal_type.quartet_value
+        return _QUARTET_VALUES[self.animal_type]
 
     def __repr__(self) -> str:
         return f"AnimalCard({self.name}, {self.quartet_value}pts)"
 
 
+# AnimalCard is frozen, so one shared instance per animal type is enough.
+# Indexed by AnimalType.
+_ANIMAL_CARDS: tuple[AnimalCard, ...] = tuple(
+    AnimalCard(animal) for animal in _ANIMAL_TYPES
+)
+
+
 # ---------------------------------------------------------------------------
 # Money cards
 # ---------------------------------------------------------------------------
@@ -68,7 +98,7 @@ class MoneyValue(Enum):
     FIVE_HUNDRED = 500
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoneyCard:
     """A single money card.
 
@@ -86,6 +116,55 @@ class MoneyCard:
         return f"MoneyCard({self.amount})"
 
 
+# Denominations in declaration order; a value's position here is its index
+# into Player.money_counts.
+_MONEY_VALUES: tuple[MoneyValue, ...] = tuple(MoneyValue)
+_MONEY_INDEX: dict[MoneyValue, int] = {
+    value: index for index, value in enumerate(_MONEY_VALUES)
+}
+_MONEY_AMOUNTS: tuple[int, ...] = tuple(v.value for v in _MONEY_VALUES)
+# Shared frozen instances, indexed like _MONEY_VALUES.
+_MONEY_CARDS: tuple[MoneyCard, ...] = tuple(MoneyCard(v) for v in _MONEY_VALUES)
+
+
+def _empty_animal_counts() -> list[int]:
+    return [0] * len(_ANIMAL_TYPES)
+
+
+def _empty_money_counts() -> list[int]:
+    return [0] * len(_MONEY_VALUES)
+
+
+def _money_spec(
+    cards: Iterable[MoneyCard] | Mapping[MoneyValue, int],
+) -> list[int]:
+    """Per-denomination counts for a card list or a {MoneyValue: count} mapping.
+
+    Raises:
+        ValueError: If a mapping key is not a MoneyValue, or a count is not a
+            non-negative integer.
+    """
+    spec = _empty_money_counts()
+    if isinstance(cards, Mapping):
+        for value, count in cards.items():
+            index = _MONEY_INDEX.get(value)
+            if index is None:
+                raise ValueError(f"{value!r} is not a MoneyValue")
+            try:
+                count = index_of(count)
+            except TypeError:
+                raise ValueError(
+                    f"Count {count!r} for {value.name} is not an integer"
+                ) from None
+            if count < 0:
+                raise ValueError(f"Negative count {count} for {value.name}")
+            spec[index] += count
+    else:
+        for card in cards:
+            spec[_MONEY_INDEX[card.value]] += 1
+    return spec
+
+
 # ---------------------------------------------------------------------------
 # Deck (animal draw pile)
 # ---------------------------------------------------------------------------
@@ -94,31 +173,60 @@ class Deck:
     """The 40-card animal draw pile.
 
     Initializes one card per animal type x 4 copies, supports shuffling
-    and drawing from the top.
+    and drawing from the top.  The pile is stored as a fixed-size
+    ``bytearray`` of animal indices (positions in ``AnimalType``), which
+    simulation code can read directly; ``AnimalCard`` objects are only
+    produced by ``draw``.  Drawing moves a ``_top`` cursor down, so a deck
+    can be reset and reused.
+
+    Args:
+        rng: Random source used for shuffling.  Pass a seeded
+            ``random.Random`` for reproducible games; defaults to a fresh
+            independently seeded instance.
     """
 
     CARDS_PER_ANIMAL: int = 4
 
-    def __init__(self) -> None:
-        self._cards: list[AnimalCard] = [
-            AnimalCard(animal_type=animal)
-            for animal in AnimalType
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self._rng: random.Random = rng if rng is not None else random.Random()
+        self._cards: bytearray = bytearray(
+            index
+            for index in range(len(_ANIMAL_TYPES))
             for _ in range(self.CARDS_PER_ANIMAL)
-        ]
+        )
+        # Cards at indices [0, _top) are still in the pile; the top is _top - 1.
+        self._top: int = len(self._cards)
 
     def shuffle(self) -> None:
-        """Randomly shuffle the draw pile in place."""
-        random.shuffle(self._cards)
+        """Randomly shuffle the undrawn cards in place."""
+        if self._top == len(self._cards):
+            self._rng.shuffle(self._cards)
+        else:
+            self._cards[:self._top] = self._rng.sample(
+                self._cards[:self._top], self._top
+            )
+
+    def reset(self) -> None:
+        """Return every drawn card to the pile (order is kept, not reshuffled)."""
+        self._top = len(self._cards)
+
+    def draw_index(self) -> Optional[int]:
+        """Remove the top card and return its animal index, or None if empty."""
+        if self._top == 0:
+            return None
+        self._top -= 1
+        return self._cards[self._top]
 
     def draw(self) -> Optional[AnimalCard]:
         """Remove and return the top card, or None if the deck is empty."""
-        if not self._cards:
+        if self._top == 0:
             return None
-        return self._cards.pop()
+        self._top -= 1
+        return _ANIMAL_CARDS[self._cards[self._top]]
 
     @property
     def remaining(self) -> int:
-        return len(self._cards)
+        return self._top
 
     def __len__(self) -> int:
         return self.remaining
@@ -131,49 +239,131 @@ class Deck:
 # Player
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """A player in the game.
 
     Attributes:
         name: Display name for this player.
-        animals: Publicly visible collection of won animal cards.
-        money: Hidden hand of money cards (private information).
+        animals: Publicly visible collection of won animal cards, as a tuple.
+            Grow it with ``add_animal``; assigning a new collection is
+            allowed and recomputes ``animal_counts``.
+        money_counts: Hidden hand of money cards (private information), stored
+            as the number of cards held per MoneyValue, in declaration order.
+        animal_counts: Number of cards owned per AnimalType, in declaration
+            order.  Derived from ``animals`` and always updated in place
+            (``Game.ownership`` aliases it); not an init argument.
     """
 
     name: str
-    animals: list[AnimalCard] = field(default_factory=list)
-    money: list[MoneyCard] = field(default_factory=list)
+    animals: InitVar[Iterable[AnimalCard]] = ()
+    money_counts: list[int] = field(default_factory=_empty_money_counts)
+    animal_counts: list[int] = field(
+        init=False, repr=False, compare=False, default_factory=_empty_animal_counts
+    )
+    _animals: tuple[AnimalCard, ...] = field(init=False, repr=False, default=())
+
+    def __post_init__(self, animals: Iterable[AnimalCard]) -> None:
+        self._set_animals(animals)
+
+    def _get_animals(self) -> tuple[AnimalCard, ...]:
+        return self._animals
+
+    def _set_animals(self, cards: Iterable[AnimalCard]) -> None:
+        self._animals = tuple(cards)
+        counts = _empty_animal_counts()
+        for card in self._animals:
+            counts[card.animal_type] += 1
+        self.animal_counts[:] = counts
+
+    @property
+    def money(self) -> tuple[MoneyCard, ...]:
+        """The money cards in hand, smallest first (rebuilt on every access).
+
+        This is a read-only snapshot; change the hand with ``add_money`` and
+        ``remove_money``, the only methods that modify it.
+        """
+        cards: list[MoneyCard] = []
+        for card, count in zip(_MONEY_CARDS, self.money_counts):
+            cards.extend([card] * count)
+        return tuple(cards)
 
     @property
     def total_money(self) -> int:
         """Sum of all money card values in hand."""
-        return sum(card.amount for card in self.money)
+        return sum(map(mul, self.money_counts, _MONEY_AMOUNTS))
+
+    def can_pay(self, amount: int) -> bool:
+        """Whether the hand can settle a payment of ``amount``.
+
+        No change is given, so any set of cards worth at least ``amount``
+        settles it; this reduces to comparing against the hand's total.
+        """
+        return self.total_money >= amount
 
-    def add_money(self, cards: list[MoneyCard]) -> None:
+    def add_money(self, cards: Iterable[MoneyCard]) -> None:
         """Add one or more money cards to the player's hidden hand."""
-        self.money.extend(cards)
+        counts = self.money_counts
+        for card in cards:
+            counts[_MONEY_INDEX[card.value]] += 1
+
+    def missing_money(
+        self, cards: Iterable[MoneyCard] | Mapping[MoneyValue, int]
+    ) -> Optional[MoneyCard]:
+        """Return a card the hand is short of, or None if it holds them all.
 
-    def remove_money(self, cards: list[MoneyCard]) -> None:
+        Duplicate denominations are counted, so two 50s require two 50s.
+
+        Raises:
+            ValueError: If the mapping has a key that is not a MoneyValue, or
+                a count that is not a non-negative integer.
+        """
+        spec = _money_spec(cards)
+        for card, needed, held in zip(_MONEY_CARDS, spec, self.money_counts):
+            if needed > held:
+                return card
+        return None
+
+    def remove_money(
+        self, cards: Iterable[MoneyCard] | Mapping[MoneyValue, int]
+    ) -> None:
         """Remove specific money cards from the player's hand.
 
+        Accepts either the cards themselves or a {MoneyValue: count} mapping.
+        Nothing is removed unless the hand holds every requested card.
+
         Raises:
-            ValueError: If a card to remove is not in the player's hand.
+            ValueError: If a card to remove is not in the player's hand, or
+                the mapping has a key that is not a MoneyValue or a count
+                that is not a non-negative integer.
         """
-        for card in cards:
-            self.money.remove(card)
+        spec = _money_spec(cards)
+        counts = self.money_counts
+        for card, needed, held in zip(_MONEY_CARDS, spec, counts):
+            if needed > held:
+                raise ValueError(f"{self.name} does not hold {card}")
+        counts[:] = map(sub, counts, spec)
 
     def add_animal(self, card: AnimalCard) -> None:
         """Add an animal card to the player's public inventory."""
-        self.animals.append(card)
+        self._animals += (card,)
+        self.animal_counts[card.animal_type] += 1
 
     def has_animal(self, animal_type: AnimalType) -> bool:
         """Check whether the player owns at least one card of the given type."""
-        return any(c.animal_type is animal_type for c in self.animals)
+        return self.animal_counts[animal_type] > 0
 
     def __repr__(self) -> str:
         return (
             f"Player({self.name}, "
             f"{len(self.animals)} animals, "
-            f"{len(self.money)} money cards)"
+            f"{sum(self.money_counts)} money cards)"
         )
+
+
+# Installed after the dataclass is built: inside the class body the property
+# would be taken as the default of the ``animals`` init argument.
+Player.animals = property(  # type: ignore[assignment]
+    Player._get_animals, Player._set_animals,
+    doc="Won animal cards; assigning recomputes ``animal_counts`` in place.",
+)
@@ -0,0 +1,358 @@
+"""Batched Monte-Carlo rollouts of Kuhhandel auctions, compiled with Numba.
+
+The object-based engine in ``engine.game_state`` plays one game at a time
+through Python method calls.  This module re-implements the auction loop on
+plain integer arrays so that thousands of random games can be simulated in
+compiled code without creating any Python objects.
+
+Encoding (all indices follow declaration order of the engine enums):
+    deck:    uint8[40]    animal indices, top of the pile is the last entry.
+    money:   int64[P, 6]  per-player count of each MoneyValue denomination.
+    animals: int64[P, 10] per-player count of each AnimalType.
+
+Rollout policy: every auction is played by random agents.  Bidders take turns
+clockwise from the auctioneer and either raise by 10-40 (only if they could
+pay the new bid) or drop out.  The last bidder standing wins the auction, as
+in ``Game.pass_auction``.  The auctioneer then buys the animal themselves with
+probability 1/2 when they can afford it.  Payment uses the payer's largest
+cards first, and no change is given.
+
+Scoring follows the Kuhhandel rule for completed quartets: the sum of the
+quartet values a player completed, multiplied by the number of quartets they
+completed.  Cow trades are not modelled, so incomplete sets score nothing.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+from engine.game_state import (
+    DONKEY_BONUS,
+    MAX_PLAYERS,
+    MIN_PLAYERS,
+    STARTING_MONEY_COUNTS,
+)
+from engine.models import AnimalType, Deck, MoneyValue
+
+N_ANIMALS: int = len(AnimalType)
+N_DENOMINATIONS: int = len(MoneyValue)
+CARDS_PER_ANIMAL: int = Deck.CARDS_PER_ANIMAL
+DECK_SIZE: int = N_ANIMALS * CARDS_PER_ANIMAL
+
+# Lookup tables derived from the engine so both code paths share one source.
+QUARTET_VALUES: np.ndarray = np.array(
+    [animal.quartet_value for animal in AnimalType], dtype=np.int64
+)
+MONEY_AMOUNTS: np.ndarray = np.array(
+    [value.value for value in MoneyValue], dtype=np.int64
+)
+STARTING_COUNTS: np.ndarray = np.array(STARTING_MONEY_COUNTS, dtype=np.int64)
+# Denomination index of the bonus card for the 1st..4th Donkey.
+DONKEY_BONUS_INDEX: np.ndarray = np.array(
+    [list(MoneyValue).index(DONKEY_BONUS[n]) for n in sorted(DONKEY_BONUS)],
+    dtype=np.int64,
+)
+DONKEY_INDEX: int = int(AnimalType.DONKEY)
+
+# Base seeds are passed to the kernels as int64.
+MIN_SEED: int = int(np.iinfo(np.int64).min)
+MAX_SEED: int = int(np.iinfo(np.int64).max)
+
+# SplitMix64 increment (2**64 / golden ratio), used to space out game streams.
+_GOLDEN_GAMMA: np.uint64 = np.uint64(0x9E3779B97F4A7C15)
+
+# Chance that a bidder who can afford a raise actually makes it.
+RAISE_PROBABILITY: float = 0.6
+# Chance that the auctioneer buys the animal when they can afford to.
+AUCTIONEER_BUY_PROBABILITY: float = 0.5
+
+
+# Every kernel is compiled eagerly from an explicit signature when this module
+# is imported (loaded from the on-disk cache after the first run), so the first
+# simulate_games call pays no JIT latency.  Array arguments are declared
+# C-contiguous, as all buffers here are.  Indices are computed from loop
+# bounds and table sizes, so bounds checking is pinned off regardless of the
+# NUMBA_BOUNDSCHECK environment setting.
+_JIT_OPTIONS: dict = dict(cache=True, boundscheck=False)
+
+
+# ---------------------------------------------------------------------------
+# Pure-int helpers
+# ---------------------------------------------------------------------------
+
+@njit("boolean(int64, int64)", **_JIT_OPTIONS)
+def _is_valid_bid(amount: int, highest_bid: int) -> bool:
+    """Mirror of ``Game.process_bid``: a multiple of 10, strictly above the top bid."""
+    return amount > highest_bid and amount % 10 == 0
+
+
+@njit("int64(int64[::1])", **_JIT_OPTIONS)
+def _total_money(counts: np.ndarray) -> int:
+    """Face value of a single player's denomination counts."""
+    total = 0
+    for d in range(N_DENOMINATIONS):
+        total += counts[d] * MONEY_AMOUNTS[d]
+    return total
+
+
+@njit("int64(int64[:, ::1], int64, int64, int64)", **_JIT_OPTIONS)
+def _pay(money: np.ndarray, payer: int, payee: int, amount: int) -> int:
+    """Move cards worth at least ``amount`` from payer to payee (no change given).
+
+    Cards are taken greedily from the largest denomination down without
+    exceeding the amount.  If that leaves a shortfall, the smallest remaining
+    card that covers it is added.  The caller must ensure the payer can afford
+    ``amount``.
+
+    Returns:
+        The total face value actually transferred.
+    """
+    remaining = amount
+    paid = 0
+    # Denomination 0 (the zero card) never helps to reach the amount.
+    for d in range(N_DENOMINATIONS - 1, 0, -1):
+        value = MONEY_AMOUNTS[d]
+        while remaining > 0 and money[payer, d] > 0 and value <= remaining:
+            money[payer, d] -= 1
+            money[payee, d] += 1
+            remaining -= value
+            paid += value
+    if remaining > 0:
+        for d in range(1, N_DENOMINATIONS):
+            if money[payer, d] > 0 and MONEY_AMOUNTS[d] >= remaining:
+                money[payer, d] -= 1
+                money[payee, d] += 1
+                paid += MONEY_AMOUNTS[d]
+                break
+    return paid
+
+
+@njit("int64(int64[:, ::1], int64)", **_JIT_OPTIONS)
+def _score(animals: np.ndarray, player: int) -> int:
+    """Quartet score: sum of completed quartet values x number of quartets."""
+    quartets = 0
+    value = 0
+    for a in range(N_ANIMALS):
+        if animals[player, a] == CARDS_PER_ANIMAL:
+            quartets += 1
+            value += QUARTET_VALUES[a]
+    return value * quartets
+
+
+@njit("int64(int64[::1], int64[::1])", **_JIT_OPTIONS)
+def _pick_winner(scores: np.ndarray, totals: np.ndarray) -> int:
+    """Index of the winner: highest score, then most money, then lowest index."""
+    best = 0
+    for p in range(1, scores.shape[0]):
+        if scores[p] > scores[best] or (
+            scores[p] == scores[best] and totals[p] > totals[best]
+        ):
+            best = p
+    return best
+
+
+@njit("uint64(uint64)", **_JIT_OPTIONS)
+def _mix64(z: np.uint64) -> np.uint64:
+    """SplitMix64 finalizer: a bijective scramble of a 64-bit integer."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+@njit("uint32(int64, int64)", **_JIT_OPTIONS)
+def _game_seed(seed: int, game: int) -> int:
+    """32-bit seed for game ``game`` of the batch with base seed ``seed``.
+
+    The base seed is scrambled before the game offset is added, so batches
+    with neighbouring base seeds draw unrelated streams instead of replaying
+    each other's games shifted by one.
+    """
+    z = _mix64(np.uint64(seed)) + np.uint64(game) * _GOLDEN_GAMMA
+    return np.uint32(_mix64(z) >> np.uint64(32))
+
+
+# ---------------------------------------------------------------------------
+# Rollout
+# ---------------------------------------------------------------------------
+
+@njit("UniTuple(int64, 2)(int64[:, ::1], int64, boolean[::1])", **_JIT_OPTIONS)
+def _run_bidding(
+    money: np.ndarray, auctioneer: int, active: np.ndarray
+) -> tuple[int, int]:
+    """Play one round of random bidding.
+
+    ``active`` is a scratch buffer of length n_players, overwritten here.
+
+    Returns:
+        (highest_bid, highest_bidder_index) once a single bidder remains.
+    """
+    n_players = money.shape[0]
+    active[:] = True
+    active[auctioneer] = False
+    n_active = n_players - 1
+    highest_bid = 0
+    highest_bidder = -1
+    p = auctioneer
+    while n_active > 1:
+        p = (p + 1) % n_players
+        if not active[p] or p == highest_bidder:
+            continue
+        bid = highest_bid + 10 * np.random.randint(1, 5)
+        if (
+            _is_valid_bid(bid, highest_bid)
+            and _total_money(money[p]) >= bid
+            and np.random.random() < RAISE_PROBABILITY
+        ):
+            highest_bid = bid
+            highest_bidder = p
+        else:
+            active[p] = False
+            n_active -= 1
+    for p in range(n_players):
+        if active[p]:
+            highest_bidder = p
+    return highest_bid, highest_bidder
+
+
+@njit(
+    "int64(int64[::1], uint8[::1], int64[:, ::1], int64[:, ::1], int64[::1], "
+    "boolean[::1])",
+    **_JIT_OPTIONS,
+)
+def _simulate_one(
+    scores: np.ndarray,
+    deck: np.ndarray,
+    money: np.ndarray,
+    animals: np.ndarray,
+    totals: np.ndarray,
+    active: np.ndarray,
+) -> int:
+    """Play one random game, fill ``scores`` (length n_players), return the winner.
+
+    All other arguments are the calling thread's scratch buffers, reset here
+    at the start of the game, so a rollout never allocates.
+    """
+    n_players = scores.shape[0]
+    for i in range(DECK_SIZE):
+        deck[i] = i // CARDS_PER_ANIMAL
+    # Inline Fisher-Yates shuffle.
+    for i in range(DECK_SIZE - 1, 0, -1):
+        j = np.random.randint(0, i + 1)
+        deck[i], deck[j] = deck[j], deck[i]
+
+    for p in range(n_players):
+        money[p, :] = STARTING_COUNTS
+    animals[:, :] = 0
+    donkeys_drawn = 0
+    turn = 0
+
+    for top in range(DECK_SIZE - 1, -1, -1):
+        animal = deck[top]
+        if animal == DONKEY_INDEX:
+            bonus = DONKEY_BONUS_INDEX[donkeys_drawn]
+            donkeys_drawn += 1
+            for p in range(n_players):
+                money[p, bonus] += 1
+
+        highest_bid, bidder = _run_bidding(money, turn, active)
+        if (
+            _total_money(money[turn]) >= highest_bid
+            and np.random.random() < AUCTIONEER_BUY_PROBABILITY
+        ):
+            _pay(money, turn, bidder, highest_bid)
+            animals[turn, animal] += 1
+        else:
+            _pay(money, bidder, turn, highest_bid)
+            animals[bidder, animal] += 1
+        turn = (turn + 1) % n_players
+
+    for p in range(n_players):
+        scores[p] = _score(animals, p)
+        totals[p] = _total_money(money[p])
+    return _pick_winner(scores, totals)
+
+
+@njit(
+    "Tuple((int64[::1], int64[:, ::1]))(int64, int64, int64, int64)",
+    parallel=True,
+    **_JIT_OPTIONS,
+)
+def _simulate_games(
+    n_games: int, n_players: int, seed: int, n_slots: int
+) -> tuple[np.ndarray, np.ndarray]:
+    winners = np.empty(n_games, dtype=np.int64)
+    scores = np.zeros((n_games, n_players), dtype=np.int64)
+
+    # Games are dealt round-robin to n_slots workers (one per thread).  Each
+    # slot owns its scratch buffers, allocated up front so that the parallel
+    # loop never touches the heap.
+    decks = np.empty((n_slots, DECK_SIZE), dtype=np.uint8)
+    money = np.empty((n_slots, n_players, N_DENOMINATIONS), dtype=np.int64)
+    animals = np.empty((n_slots, n_players, N_ANIMALS), dtype=np.int64)
+    totals = np.empty((n_slots, n_players), dtype=np.int64)
+    active = np.empty((n_slots, n_players), dtype=np.bool_)
+
+    for t in prange(n_slots):
+        for g in range(t, n_games, n_slots):
+            # Numba keeps one random state per thread; seeding it per game
+            # makes results independent of the thread count.
+            np.random.seed(_game_seed(seed, g))
+            winners[g] = _simulate_one(
+                scores[g], decks[t], money[t], animals[t], totals[t], active[t]
+            )
+    return winners, scores
+
+
+def shuffle_decks(decks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Shuffle every row of a batch of decks in place with one vectorized call.
+
+    Args:
+        decks: Array of shape (n_decks, 40) holding animal indices, e.g.
+            ``np.tile(new_deck(), (n, 1))``.
+        rng: NumPy random generator.
+
+    Returns:
+        ``decks``, with each row independently permuted.
+    """
+    return rng.permuted(decks, axis=1, out=decks)
+
+
+def new_deck() -> np.ndarray:
+    """An unshuffled deck as a uint8 array of animal indices (same order as Deck)."""
+    return np.repeat(np.arange(N_ANIMALS, dtype=np.uint8), CARDS_PER_ANIMAL)
+
+
+def simulate_games(
+    n_games: int, n_players: int, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Simulate ``n_games`` independent random games in parallel.
+
+    Args:
+        n_games: Number of games to roll out.
+        n_players: Players per game (3-5).
+        seed: Base seed.  Game ``g`` is seeded with a hash of ``(seed, g)``,
+            so results are reproducible regardless of thread count, and
+            batches with different base seeds do not share games.
+
+    Returns:
+        (winners, scores): winner index per game, shape (n_games,), and final
+        quartet scores, shape (n_games, n_players).
+
+    Raises:
+        ValueError: If n_players is outside 3-5, n_games is negative, or seed
+            does not fit an int64.
+    """
+    if not MIN_PLAYERS <= n_players <= MAX_PLAYERS:
+        raise ValueError(
+            f"Kuhhandel requires {MIN_PLAYERS}-{MAX_PLAYERS} players, "
+            f"got {n_players}"
+        )
+    if n_games < 0:
+        raise ValueError(f"n_games must be non-negative, got {n_games}")
+    if not MIN_SEED <= seed <= MAX_SEED:
+        raise ValueError(
+            f"seed must be between {MIN_SEED} and {MAX_SEED}, got {seed}"
+        )
+    n_slots = max(1, min(get_num_threads(), n_games))
+    return _simulate_games(n_games, n_players, seed, n_slots)
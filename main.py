@@ -1,16 +1,66 @@
-# This is a sample Python script.
+"""Command-line entry point: run batched random Kuhhandel simulations.
 
-# Press Umschalt+F10 to execute it or replace it with your code.
-# Press Double Shift to search everywhere for classes, files, tool windows, actions, and settings.
+Example:
+    python main.py --games 100000 --players 4 --threads 8
+"""
 
+from __future__ import annotations
 
-def print_hi(name):
-    # Use a breakpoint in the code line below to debug your script.
-    print(f'Hi, {name}')  # Press Strg+F8 to toggle the breakpoint.
+import argparse
+import time
 
+import numba
+import numpy as np
 
-# Press the green button in the gutter to run the script.
-if __name__ == '__main__':
-    print_hi('PyCharm')
+from engine.game_state import MAX_PLAYERS, MIN_PLAYERS
+from engine.sim import MAX_SEED, MIN_SEED, simulate_games
 
-# See PyCharm help at https://www.jetbrains.com/help/pycharm/
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options for a simulation run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10_000, help="games to simulate")
+    parser.add_argument("--players", type=int, default=4, help="players per game (3-5)")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=numba.config.NUMBA_NUM_THREADS,
+        help="worker threads (default: all available)",
+    )
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if not MIN_PLAYERS <= args.players <= MAX_PLAYERS:
+        parser.error(f"--players must be between {MIN_PLAYERS} and {MAX_PLAYERS}")
+    if not MIN_SEED <= args.seed <= MAX_SEED:
+        parser.error(f"--seed must be between {MIN_SEED} and {MAX_SEED}")
+    if not 1 <= args.threads <= numba.config.NUMBA_NUM_THREADS:
+        parser.error(
+            f"--threads must be between 1 and {numba.config.NUMBA_NUM_THREADS}"
+        )
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    numba.set_num_threads(args.threads)
+
+    start = time.perf_counter()
+    winners, scores = simulate_games(args.games, args.players, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Simulated {args.games} games with {args.players} players "
+        f"on {args.threads} thread(s) in {elapsed:.2f}s"
+    )
+    wins = np.bincount(winners, minlength=args.players)
+    for p in range(args.players):
+        print(
+            f"  Player {p}: {wins[p] / args.games:6.1%} wins, "
+            f"mean score {scores[:, p].mean():8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
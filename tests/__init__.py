@@ -0,0 +1,9 @@
+"""Test suite; every module also runs standalone via ``python -m tests.<module>``."""
+
+from collections.abc import Callable
+
+
+def run(message: str, test: Callable[..., None], *args: object) -> None:
+    """Call a test from a module's script driver and report it as passed."""
+    test(*args)
+    print(f"  {message}")
@@ -0,0 +1,90 @@
+"""Verify the packed-int auction core against the Game bidding rules."""
+
+import pytest
+
+from engine.auction import (
+    AUCTION_DECIDE,
+    AUCTION_NO_BIDS,
+    AUCTION_OPEN,
+    COMPILED,
+    AuctionC,
+    PyAuction,
+)
+
+# Check the reference implementation, and the extension when it is built.
+_IMPLEMENTATIONS = [PyAuction] + ([AuctionC] if COMPILED else [])
+_IMPLEMENTATION_IDS = [cls.__name__ for cls in _IMPLEMENTATIONS]
+
+
+def _open_auction(cls):
+    """Helper: Alice (0) auctions to Bob (1) and Carol (2)."""
+    return cls(8, 0, 0b110)
+
+
+@pytest.mark.parametrize("cls", _IMPLEMENTATIONS, ids=_IMPLEMENTATION_IDS)
+def test_process_bid(cls) -> None:
+    auction = _open_auction(cls)
+    auction.process_bid(1, 10)
+    auction.process_bid(2, 30)
+    assert auction.highest_bid == 30
+    assert auction.highest_bidder == 2
+    for player, amount in ((0, 40), (1, 30), (1, 20), (2, 45), (7, 50)):
+        with pytest.raises(ValueError):
+            auction.process_bid(player, amount)
+
+
+@pytest.mark.parametrize("cls", _IMPLEMENTATIONS, ids=_IMPLEMENTATION_IDS)
+def test_out_of_range_arguments_raise_value_error(cls) -> None:
+    for args in ((8, 0, -1), (8, 0, 1 << 40), (8, 2**40, 0b110)):
+        if cls is PyAuction:
+            cls(*args)
+        else:
+            # The compiled fields are C ints: such values are out of range.
+            with pytest.raises(ValueError):
+                cls(*args)
+
+    auction = _open_auction(cls)
+    for player in (-1, 2**40, -2**70):
+        with pytest.raises(ValueError):
+            auction.process_bid(player, 10)
+        with pytest.raises(ValueError):
+            auction.pass_auction(player)
+    with pytest.raises(ValueError):
+        auction.process_bid(1, -2**70)
+    if cls is PyAuction:
+        auction.process_bid(1, 10**12)
+        assert auction.highest_bid == 10**12
+    else:
+        # The compiled fields are C ints: huge bids are out of range.
+        with pytest.raises(ValueError):
+            auction.process_bid(1, 10**12)
+
+
+@pytest.mark.parametrize("cls", _IMPLEMENTATIONS, ids=_IMPLEMENTATION_IDS)
+def test_pass_auction_outcomes(cls) -> None:
+    auction = cls(8, 0, 0b1110)  # four players
+    assert auction.pass_auction(1) == AUCTION_OPEN
+    assert auction.pass_auction(3) == AUCTION_DECIDE
+    assert auction.highest_bidder == 2
+
+    auction = _open_auction(cls)
+    auction.active_mask = 0b100
+    assert auction.pass_auction(2) == AUCTION_NO_BIDS
+
+    with pytest.raises(ValueError):
+        _open_auction(cls).pass_auction(0)  # auctioneer
+
+
+if __name__ == "__main__":
+    from tests import run
+
+    print(f"Running auction core tests (compiled: {COMPILED})...\n")
+    for cls in _IMPLEMENTATIONS:
+        name = cls.__name__
+        run(f"{name} process_bid rules OK", test_process_bid, cls)
+        run(
+            f"{name} out-of-range arguments raise ValueError OK",
+            test_out_of_range_arguments_raise_value_error, cls,
+        )
+        run(f"{name} pass_auction outcomes OK", test_pass_auction_outcomes, cls)
+    print("\nAll tests passed.")
@@ -1,5 +1,9 @@
 """Verify that the Kuhhandel data models initialize and behave correctly."""
 
+import random
+
+import pytest
+
 from engine.models import AnimalCard, AnimalType, Deck, MoneyCard, MoneyValue, Player
 
 
@@ -7,7 +11,9 @@ def test_animal_card_properties() -> None:
     card = AnimalCard(AnimalType.COW)
     assert card.name == "Cow"
     assert card.quartet_value == 800
-    print(f"  AnimalCard properties OK: {card}")
+    assert card.animal_type == 8  # IntEnum: usable directly as an index
+    assert card == AnimalCard(AnimalType.COW)
+    assert hash(card) == hash(AnimalCard(AnimalType.COW))
 
 
 def test_money_card_properties() -> None:
@@ -15,7 +21,6 @@ def test_money_card_properties() -> None:
     assert card.amount == 500
     zero = MoneyCard(MoneyValue.ZERO)
     assert zero.amount == 0
-    print(f"  MoneyCard properties OK: {card}, {zero}")
 
 
 def test_deck_initialization() -> None:
@@ -33,7 +38,6 @@ def test_deck_initialization() -> None:
     assert len(counts) == 10, f"Expected 10 animal types, got {len(counts)}"
     for animal, count in counts.items():
         assert count == 4, f"{animal.animal_name} has {count} cards, expected 4"
-    print(f"  Deck initialization OK: 40 cards, 10 types x 4 each")
 
 
 def test_deck_shuffle() -> None:
@@ -49,7 +53,14 @@ def test_deck_shuffle() -> None:
     assert order_a != order_b, "Shuffled deck has same order as unshuffled (extremely unlikely)"
     # But they should contain the same cards
     assert sorted(order_a, key=lambda c: c.name) == sorted(order_b, key=lambda c: c.name)
-    print("  Deck shuffle OK: order changed, same cards present")
+
+
+def test_deck_seeded_rng() -> None:
+    deck_a = Deck(random.Random(42))
+    deck_b = Deck(random.Random(42))
+    deck_a.shuffle()
+    deck_b.shuffle()
+    assert [deck_a.draw() for _ in range(40)] == [deck_b.draw() for _ in range(40)]
 
 
 def test_deck_draw_empties() -> None:
@@ -59,7 +70,47 @@ def test_deck_draw_empties() -> None:
         assert card is not None
     assert deck.draw() is None
     assert len(deck) == 0
-    print("  Deck draw-to-empty OK: returns None when exhausted")
+
+
+def test_deck_draw_index() -> None:
+    deck = Deck()
+    index = deck.draw_index()
+    assert index is not None
+    assert 0 <= index < len(AnimalType)
+    assert deck.remaining == 39
+
+    # draw_index and draw consume the same pile.
+    card = deck.draw()
+    assert card is not None
+    assert card.animal_type is AnimalType(index)  # unshuffled: same type on top
+    while deck.draw_index() is not None:
+        pass
+    assert len(deck) == 0
+
+
+def test_deck_reset() -> None:
+    deck = Deck()
+    deck.shuffle()
+    first_pass = [deck.draw() for _ in range(40)]
+    assert deck.draw() is None
+
+    deck.reset()
+    assert len(deck) == 40
+    second_pass = [deck.draw() for _ in range(40)]
+    assert second_pass == first_pass, "reset should restore the same order"
+
+
+def test_deck_shuffle_after_draw() -> None:
+    deck = Deck()
+    drawn = [deck.draw() for _ in range(10)]
+    deck.shuffle()
+    assert len(deck) == 30
+
+    rest = [deck.draw() for _ in range(30)]
+    # Shuffling must not bring drawn cards back into the pile.
+    fresh = Deck()
+    full = sorted(drawn + rest, key=lambda c: c.name)
+    assert full == sorted((fresh.draw() for _ in range(40)), key=lambda c: c.name)
 
 
 def test_player() -> None:
@@ -67,13 +118,17 @@ def test_player() -> None:
     assert player.total_money == 0
     assert len(player.animals) == 0
 
-    player.money.append(MoneyCard(MoneyValue.HUNDRED))
-    player.money.append(MoneyCard(MoneyValue.FIFTY))
+    player.add_money([MoneyCard(MoneyValue.HUNDRED), MoneyCard(MoneyValue.FIFTY)])
     assert player.total_money == 150
+    assert player.money_counts == [0, 0, 1, 1, 0, 0]
+    assert player.money == (MoneyCard(MoneyValue.FIFTY), MoneyCard(MoneyValue.HUNDRED))
+    with pytest.raises(AttributeError):
+        player.money.append(MoneyCard(MoneyValue.TEN))  # read-only snapshot
 
-    player.animals.append(AnimalCard(AnimalType.HORSE))
+    player.add_animal(AnimalCard(AnimalType.HORSE))
     assert len(player.animals) == 1
-    print(f"  Player OK: {player}")
+    with pytest.raises(AttributeError):
+        player.animals.append(AnimalCard(AnimalType.HORSE))  # add_animal only
 
 
 def test_player_add_money() -> None:
@@ -82,7 +137,16 @@ def test_player_add_money() -> None:
     player.add_money(cards)
     assert len(player.money) == 2
     assert player.total_money == 60
-    print("  add_money OK")
+
+
+def test_player_can_pay() -> None:
+    player = Player(name="Alice")
+    assert player.can_pay(0)
+    assert not player.can_pay(10)
+    player.add_money([MoneyCard(MoneyValue.FIFTY)])
+    assert player.can_pay(30)  # overpaying with the 50 is allowed
+    assert player.can_pay(50)
+    assert not player.can_pay(60)
 
 
 def test_player_remove_money() -> None:
@@ -93,17 +157,61 @@ def test_player_remove_money() -> None:
     player.remove_money([card_10])
     assert len(player.money) == 1
     assert player.total_money == 50
-    print("  remove_money OK")
 
 
 def test_player_remove_money_missing_raises() -> None:
     player = Player(name="Carol")
-    try:
+    with pytest.raises(ValueError):
         player.remove_money([MoneyCard(MoneyValue.FIVE_HUNDRED)])
-        assert False, "Expected ValueError"
-    except ValueError:
-        pass
-    print("  remove_money raises on missing card OK")
+
+
+def test_player_remove_money_is_atomic() -> None:
+    player = Player(name="Carol")
+    player.add_money([MoneyCard(MoneyValue.TEN), MoneyCard(MoneyValue.FIFTY)])
+    with pytest.raises(ValueError):
+        # The 10 is held, the second 50 is not: nothing may be removed.
+        player.remove_money([
+            MoneyCard(MoneyValue.TEN),
+            MoneyCard(MoneyValue.FIFTY),
+            MoneyCard(MoneyValue.FIFTY),
+        ])
+    assert player.total_money == 60
+
+
+def test_player_remove_money_by_denomination() -> None:
+    player = Player(name="Dave")
+    player.add_money([MoneyCard(MoneyValue.TEN)] * 4 + [MoneyCard(MoneyValue.FIFTY)])
+    assert player.missing_money({MoneyValue.TEN: 5}) == MoneyCard(MoneyValue.TEN)
+    assert player.missing_money({MoneyValue.TEN: 3}) is None
+
+    player.remove_money({MoneyValue.TEN: 3, MoneyValue.FIFTY: 1})
+    assert player.money == (MoneyCard(MoneyValue.TEN),)
+
+
+def test_player_remove_money_rejects_negative_count() -> None:
+    player = Player(name="Dave")
+    with pytest.raises(ValueError):
+        player.remove_money({MoneyValue.FIVE_HUNDRED: -3})
+    with pytest.raises(ValueError):
+        player.missing_money({MoneyValue.FIVE_HUNDRED: -3})
+    assert player.total_money == 0
+
+
+def test_player_remove_money_rejects_non_integer_count() -> None:
+    player = Player(name="Dave")
+    player.add_money([MoneyCard(MoneyValue.TEN)] * 2)
+    for count in (1.5, "1", None):
+        with pytest.raises(ValueError):
+            player.remove_money({MoneyValue.TEN: count})
+    assert player.money_counts == [0, 2, 0, 0, 0, 0]
+
+
+def test_player_remove_money_rejects_unknown_key() -> None:
+    player = Player(name="Dave")
+    player.add_money([MoneyCard(MoneyValue.TEN)])
+    with pytest.raises(ValueError):
+        player.remove_money({10: 1})
+    assert player.total_money == 10
 
 
 def test_player_add_animal() -> None:
@@ -111,7 +219,6 @@ def test_player_add_animal() -> None:
     player.add_animal(AnimalCard(AnimalType.COW))
     assert len(player.animals) == 1
     assert player.animals[0].name == "Cow"
-    print("  add_animal OK")
 
 
 def test_player_has_animal() -> None:
@@ -120,20 +227,68 @@ def test_player_has_animal() -> None:
     player.add_animal(AnimalCard(AnimalType.HORSE))
     assert player.has_animal(AnimalType.HORSE)
     assert not player.has_animal(AnimalType.PIG)
-    print("  has_animal OK")
+
+
+def test_player_built_with_animals() -> None:
+    cards = [AnimalCard(AnimalType.COW), AnimalCard(AnimalType.COW)]
+    player = Player("Frank", animals=cards)
+    assert player.animals == tuple(cards)
+    assert player.has_animal(AnimalType.COW)
+    assert player.animal_counts[AnimalType.COW] == 2
+    for animal_type in AnimalType:
+        assert player.has_animal(animal_type) == any(
+            card.animal_type is animal_type for card in player.animals
+        )
 
 
 if __name__ == "__main__":
+    from tests import run
+
     print("Running model tests...\n")
-    test_animal_card_properties()
-    test_money_card_properties()
-    test_deck_initialization()
-    test_deck_shuffle()
-    test_deck_draw_empties()
-    test_player()
-    test_player_add_money()
-    test_player_remove_money()
-    test_player_remove_money_missing_raises()
-    test_player_add_animal()
-    test_player_has_animal()
+    run("AnimalCard properties OK", test_animal_card_properties)
+    run("MoneyCard properties OK", test_money_card_properties)
+    run("Deck initialization OK: 40 cards, 10 types x 4 each", test_deck_initialization)
+    run("Deck shuffle OK: order changed, same cards present", test_deck_shuffle)
+    run("Deck seeded rng OK: same seed gives the same order", test_deck_seeded_rng)
+    run("Deck draw-to-empty OK: returns None when exhausted", test_deck_draw_empties)
+    run(
+        "Deck draw_index OK: returns animal indices from the same pile",
+        test_deck_draw_index,
+    )
+    run("Deck reset OK: all cards returned in the same order", test_deck_reset)
+    run(
+        "Deck shuffle after draw OK: only undrawn cards shuffled",
+        test_deck_shuffle_after_draw,
+    )
+    run("Player OK", test_player)
+    run("add_money OK", test_player_add_money)
+    run("can_pay OK", test_player_can_pay)
+    run("remove_money OK", test_player_remove_money)
+    run(
+        "remove_money raises on missing card OK",
+        test_player_remove_money_missing_raises,
+    )
+    run(
+        "remove_money leaves the hand untouched on failure OK",
+        test_player_remove_money_is_atomic,
+    )
+    run(
+        "remove_money with {MoneyValue: count} OK",
+        test_player_remove_money_by_denomination,
+    )
+    run(
+        "remove_money rejects negative counts OK",
+        test_player_remove_money_rejects_negative_count,
+    )
+    run(
+        "remove_money rejects non-integer counts OK",
+        test_player_remove_money_rejects_non_integer_count,
+    )
+    run(
+        "remove_money rejects keys that are not MoneyValues OK",
+        test_player_remove_money_rejects_unknown_key,
+    )
+    run("add_animal OK", test_player_add_animal)
+    run("has_animal OK", test_player_has_animal)
+    run("Player built with animals OK", test_player_built_with_animals)
     print("\nAll tests passed.")
@@ -0,0 +1,137 @@
+"""Verify the Numba batch simulator's helpers and rollout invariants."""
+
+import pytest
+
+# The simulator needs the optional numpy/numba stack (see requirements.txt).
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+from engine.sim import (
+    MONEY_AMOUNTS,
+    STARTING_COUNTS,
+    _game_seed,
+    _is_valid_bid,
+    _pay,
+    _pick_winner,
+    new_deck,
+    shuffle_decks,
+    simulate_games,
+)
+
+
+def test_starting_counts_match_engine() -> None:
+    # 2x0, 4x10, 1x50 → 7 cards worth 90
+    assert int(STARTING_COUNTS.sum()) == 7
+    assert int(STARTING_COUNTS @ MONEY_AMOUNTS) == 90
+
+
+def test_is_valid_bid() -> None:
+    assert _is_valid_bid(10, 0)
+    assert not _is_valid_bid(10, 10)
+    assert not _is_valid_bid(15, 0)
+
+
+def test_pay_no_change_given() -> None:
+    money = np.zeros((2, len(MONEY_AMOUNTS)), dtype=np.int64)
+    money[0, :] = STARTING_COUNTS  # 2x0, 4x10, 1x50
+    paid = _pay(money, 0, 1, 60)
+    assert paid == 60  # 50 + 10
+    assert int(money[1] @ MONEY_AMOUNTS) == 60
+
+    money[0, :] = STARTING_COUNTS
+    money[1, :] = 0
+    money[0, 1] = 0  # no tens left: must overpay with the 50
+    paid = _pay(money, 0, 1, 20)
+    assert paid == 50
+    assert int(money[0] @ MONEY_AMOUNTS) == 0
+
+
+def test_pick_winner_tie_breaks() -> None:
+    scores = np.array([100, 100, 50], dtype=np.int64)
+    totals = np.array([10, 40, 500], dtype=np.int64)
+    assert _pick_winner(scores, totals) == 1
+    totals[1] = 10
+    assert _pick_winner(scores, totals) == 0
+
+
+def test_shuffle_decks() -> None:
+    decks = np.tile(new_deck(), (50, 1))
+    out = shuffle_decks(decks, np.random.default_rng(0))
+    assert out is decks
+    # Every row is still a full deck.
+    assert np.all(np.sort(decks, axis=1) == new_deck())
+    # Rows are permuted independently.
+    assert len({row.tobytes() for row in decks}) == 50
+
+
+def test_simulate_games_shapes_and_invariants() -> None:
+    for n_players in (3, 4, 5):
+        winners, scores = simulate_games(200, n_players, seed=7)
+        assert winners.shape == (200,)
+        assert scores.shape == (200, n_players)
+        assert np.all((winners >= 0) & (winners < n_players))
+        assert np.all(scores >= 0)
+        # The winner never has a lower score than anyone else.
+        best = scores.max(axis=1)
+        assert np.all(scores[np.arange(200), winners] == best)
+
+
+def test_simulate_games_reproducible() -> None:
+    winners_a, scores_a = simulate_games(100, 4, seed=3)
+    winners_b, scores_b = simulate_games(100, 4, seed=3)
+    assert np.array_equal(winners_a, winners_b)
+    assert np.array_equal(scores_a, scores_b)
+
+
+def test_game_seeds_unrelated_across_base_seeds() -> None:
+    base_0 = {_game_seed(0, g) for g in range(1000)}
+    base_1 = {_game_seed(1, g) for g in range(1000)}
+    assert len(base_0) == len(base_1) == 1000
+    # seed + g would make these two sets share 999 entries.
+    assert not base_0 & base_1
+
+
+def test_simulate_games_rejects_invalid_player_count() -> None:
+    for n in (2, 6):
+        with pytest.raises(ValueError):
+            simulate_games(1, n)
+
+
+
+def test_simulate_games_rejects_out_of_range_seed() -> None:
+    for seed in (2**63, -2**63 - 1):
+        with pytest.raises(ValueError):
+            simulate_games(3, 3, seed=seed)
+    simulate_games(3, 3, seed=2**63 - 1)
+
+
+if __name__ == "__main__":
+    from tests import run
+
+    print("Running simulator tests...\n")
+    run("STARTING_COUNTS mirror STARTING_MONEY OK", test_starting_counts_match_engine)
+    run("_is_valid_bid OK", test_is_valid_bid)
+    run("_pay greedy transfer and overpayment OK", test_pay_no_change_given)
+    run("_pick_winner tie-breaking OK", test_pick_winner_tie_breaks)
+    run("shuffle_decks permutes each row independently OK", test_shuffle_decks)
+    run(
+        "simulate_games shapes and winner invariants OK",
+        test_simulate_games_shapes_and_invariants,
+    )
+    run(
+        "simulate_games reproducible with same seed OK",
+        test_simulate_games_reproducible,
+    )
+    run(
+        "game seeds unrelated across neighbouring base seeds OK",
+        test_game_seeds_unrelated_across_base_seeds,
+    )
+    run(
+        "simulate_games rejects invalid player counts OK",
+        test_simulate_games_rejects_invalid_player_count,
+    )
+    run(
+        "simulate_games rejects seeds outside int64 OK",
+        test_simulate_games_rejects_out_of_range_seed,
+    )
+    print("\nAll tests passed.")